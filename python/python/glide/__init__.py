@@ -61,7 +61,11 @@ from glide.async_commands.stream import (
     TrimByMaxLen,
     TrimByMinId,
 )
-from glide.async_commands.transaction import ClusterTransaction, Transaction
+from glide.async_commands.transaction import (
+    ClusterTransaction,
+    Pipeline,
+    Transaction,
+)
 from glide.config import (
     BackoffStrategy,
     BaseClientConfiguration,
@@ -105,6 +109,7 @@ __all__ = [
     "GlideClusterClient",
     "Transaction",
     "ClusterTransaction",
+    "Pipeline",
     # Config
     "BaseClientConfiguration",
     "GlideClientConfiguration",
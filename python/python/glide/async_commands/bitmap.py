@@ -1,6 +1,7 @@
 # Copyright Valkey GLIDE Project Contributors - SPDX Identifier: Apache-2.0
 from abc import ABC, abstractmethod
 from enum import Enum
+from itertools import chain
 from typing import List, Optional
 
 
@@ -287,19 +288,21 @@ class BitFieldOverflow(BitFieldSubCommands):
         return [self.OVERFLOW_COMMAND_STRING, self._overflow_control.value]
 
 
-def _create_bitfield_args(subcommands: List[BitFieldSubCommands]) -> List[str]:
-    args = []
-    for subcommand in subcommands:
-        args.extend(subcommand.to_args())
-
-    return args
+def _create_bitfield_args(
+    key: str, subcommands: List[BitFieldSubCommands]
+) -> List[str]:
+    # The arguments are unpacked into a single list literal, to avoid allocating and copying intermediate lists
+    return [
+        key,
+        *chain.from_iterable(subcommand.to_args() for subcommand in subcommands),
+    ]
 
 
 def _create_bitfield_read_only_args(
+    key: str,
     subcommands: List[BitFieldGet],
 ) -> List[str]:
-    args = []
-    for subcommand in subcommands:
-        args.extend(subcommand.to_args())
-
-    return args
+    return [
+        key,
+        *chain.from_iterable(subcommand.to_args() for subcommand in subcommands),
+    ]
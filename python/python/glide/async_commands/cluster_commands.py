@@ -2,24 +2,31 @@
 
 from __future__ import annotations
 
-from typing import Dict, List, Mapping, Optional, Union, cast
+from typing import Dict, List, Mapping, Optional, Sequence, Union, cast
 
 from glide.async_commands.command_args import Limit, OrderBy
 from glide.async_commands.core import (
+    _CUSTOM_COMMAND_REQUEST_TYPE,
     CoreCommands,
     FlushMode,
     InfoSection,
     _build_sort_args,
 )
 from glide.async_commands.transaction import BaseTransaction, ClusterTransaction
-from glide.constants import TOK, TClusterResponse, TResult, TSingleNodeRoute
+from glide.constants import (
+    TOK,
+    TClusterResponse,
+    TEncodable,
+    TResult,
+    TSingleNodeRoute,
+)
 from glide.protobuf.redis_request_pb2 import RequestType
 from glide.routes import Route
 
 
 class ClusterCommands(CoreCommands):
     async def custom_command(
-        self, command_args: List[str], route: Optional[Route] = None
+        self, command_args: Sequence[TEncodable], route: Optional[Route] = None
     ) -> TResult:
         """
         Executes a single command, without checking inputs.
@@ -30,7 +37,7 @@ class ClusterCommands(CoreCommands):
 
                 connection.customCommand(["CLIENT", "LIST","TYPE", "PUBSUB"], AllNodes())
         Args:
-            command_args (List[str]): List of strings of the command's arguments.
+            command_args (Sequence[TEncodable]): Sequence of strings or bytes of the command's arguments.
             Every part of the command, including the command name and subcommands, should be added as a separate value in args.
             route (Optional[Route]): The command will be routed automatically based on the passed command's default request policy, unless `route` is provided, in which
             case the client will route the command to the nodes defined by `route`. Defaults to None.
@@ -39,7 +46,7 @@ class ClusterCommands(CoreCommands):
             TResult: The returning value depends on the executed command and the route
         """
         return await self._execute_command(
-            RequestType.CustomCommand, command_args, route
+            _CUSTOM_COMMAND_REQUEST_TYPE, command_args, route
         )
 
     async def info(
@@ -5,10 +5,14 @@ from dataclasses import dataclass
 from datetime import datetime, timedelta
 from enum import Enum
 from typing import (
+    Any,
+    Awaitable,
+    Callable,
     Dict,
     List,
     Optional,
     Protocol,
+    Sequence,
     Set,
     Tuple,
     Type,
@@ -55,7 +59,8 @@ from glide.async_commands.stream import (
     StreamTrimOptions,
     _create_xpending_range_args,
 )
-from glide.constants import TOK, TResult
+from glide.constants import TOK, TEncodable, TResult
+from glide.exceptions import RedisError
 from glide.protobuf.redis_request_pb2 import RequestType
 from glide.routes import Route
 
@@ -90,6 +95,39 @@ class ExpiryType(Enum):
     KEEP_TTL = 4, Type[None]  # Equivalent to `KEEPTTL` in the Redis API
 
 
+# The types of the expiry value allowed by each expiry type
+_EXPIRY_SET_VALUE_TYPES: Dict[ExpiryType, Tuple[type, ...]] = {
+    expiry_type: get_args(expiry_type.value[1]) for expiry_type in ExpiryType
+}
+
+# The `SET` argument of each expiry type, and a function converting the expiry value to the value sent to the server
+_EXPIRY_SET_ARGS: Dict[ExpiryType, Tuple[str, Callable[[Any], Optional[int]]]] = {
+    ExpiryType.SEC: (
+        "EX",
+        lambda value: (
+            int(value.total_seconds()) if isinstance(value, timedelta) else value
+        ),
+    ),
+    ExpiryType.MILLSEC: (
+        "PX",
+        lambda value: (
+            int(value.total_seconds() * 1000) if isinstance(value, timedelta) else value
+        ),
+    ),
+    ExpiryType.UNIX_SEC: (
+        "EXAT",
+        lambda value: int(value.timestamp()) if isinstance(value, datetime) else value,
+    ),
+    ExpiryType.UNIX_MILLSEC: (
+        "PXAT",
+        lambda value: (
+            int(value.timestamp() * 1000) if isinstance(value, datetime) else value
+        ),
+    ),
+    ExpiryType.KEEP_TTL: ("KEEPTTL", lambda value: None),
+}
+
+
 class ExpiryTypeGetEx(Enum):
     """GetEx option: The type of the expiry.
     - EX - Set the specified expire time, in seconds. Equivalent to `EX` in the Redis API.
@@ -182,6 +220,8 @@ class UpdateOptions(Enum):
 class ExpirySet:
     """SET option: Represents the expiry type and value to be executed with "SET" command."""
 
+    __slots__ = ("expiry_type", "cmd_arg", "value", "_cmd_args")
+
     def __init__(
         self,
         expiry_type: ExpiryType,
@@ -203,38 +243,27 @@ class ExpirySet:
     def set_expiry_type_and_value(
         self, expiry_type: ExpiryType, value: Optional[Union[int, datetime, timedelta]]
     ):
-        if not isinstance(value, get_args(expiry_type.value[1])):
+        if not isinstance(value, _EXPIRY_SET_VALUE_TYPES[expiry_type]):
             raise ValueError(
                 f"The value of {expiry_type} should be of type {expiry_type.value[1]}"
             )
         self.expiry_type = expiry_type
-        if self.expiry_type == ExpiryType.SEC:
-            self.cmd_arg = "EX"
-            if isinstance(value, timedelta):
-                value = int(value.total_seconds())
-        elif self.expiry_type == ExpiryType.MILLSEC:
-            self.cmd_arg = "PX"
-            if isinstance(value, timedelta):
-                value = int(value.total_seconds() * 1000)
-        elif self.expiry_type == ExpiryType.UNIX_SEC:
-            self.cmd_arg = "EXAT"
-            if isinstance(value, datetime):
-                value = int(value.timestamp())
-        elif self.expiry_type == ExpiryType.UNIX_MILLSEC:
-            self.cmd_arg = "PXAT"
-            if isinstance(value, datetime):
-                value = int(value.timestamp() * 1000)
-        elif self.expiry_type == ExpiryType.KEEP_TTL:
-            self.cmd_arg = "KEEPTTL"
+        self.cmd_arg, convert_value = _EXPIRY_SET_ARGS[expiry_type]
+        value = convert_value(value)
         self.value = str(value) if value else None
+        self._cmd_args = (
+            (self.cmd_arg,) if self.value is None else (self.cmd_arg, self.value)
+        )
 
     def get_cmd_args(self) -> List[str]:
-        return [self.cmd_arg] if self.value is None else [self.cmd_arg, self.value]
+        return list(self._cmd_args)
 
 
 class ExpiryGetEx:
     """GetEx option: Represents the expiry type and value to be executed with "GetEx" command."""
 
+    __slots__ = ("expiry_type", "cmd_arg", "value")
+
     def __init__(
         self,
         expiry_type: ExpiryTypeGetEx,
@@ -307,6 +336,23 @@ class FlushMode(Enum):
     SYNC = "SYNC"
 
 
+# Accessing a `RequestType` value goes through the protobuf enum wrapper's `__getattr__`, so the request types
+# of the most frequently used commands are resolved once
+_SET_REQUEST_TYPE: RequestType.ValueType = RequestType.Set
+_GET_REQUEST_TYPE: RequestType.ValueType = RequestType.Get
+_CUSTOM_COMMAND_REQUEST_TYPE: RequestType.ValueType = RequestType.CustomCommand
+
+# The `SET` arguments that are set by `conditional_set` and `return_old_value`, for each combination of the two
+_SET_OPTIONS_ARGS: Dict[Tuple[Optional[ConditionalChange], bool], Tuple[str, ...]] = {
+    (conditional_set, return_old_value): (
+        ((conditional_set.value,) if conditional_set else ())
+        + (("GET",) if return_old_value else ())
+    )
+    for conditional_set in (None, *ConditionalChange)
+    for return_old_value in (False, True)
+}
+
+
 def _build_sort_args(
     key: str,
     by_pattern: Optional[str] = None,
@@ -344,16 +390,21 @@ class CoreCommands(Protocol):
     async def _execute_command(
         self,
         request_type: RequestType.ValueType,
-        args: List[str],
+        args: Sequence[TEncodable],
         route: Optional[Route] = ...,
     ) -> TResult: ...
 
     async def _execute_transaction(
         self,
-        commands: List[Tuple[RequestType.ValueType, List[str]]],
+        commands: List[Tuple[RequestType.ValueType, Sequence[TEncodable]]],
         route: Optional[Route] = None,
     ) -> List[TResult]: ...
 
+    def _execute_pipeline(
+        self,
+        commands: List[Tuple[RequestType.ValueType, Sequence[TEncodable]]],
+    ) -> Awaitable[List[Union[TResult, RedisError]]]: ...
+
     async def _execute_script(
         self,
         hash: str,
@@ -369,7 +420,7 @@ class CoreCommands(Protocol):
         conditional_set: Optional[ConditionalChange] = None,
         expiry: Optional[ExpirySet] = None,
         return_old_value: bool = False,
-    ) -> Optional[str]:
+    ) -> Optional[Union[TOK, bytes]]:
         """
         Set the given key with the given value. Return value is dependent on the passed options.
         See https://redis.io/commands/set/ for more details.
@@ -386,10 +437,10 @@ class CoreCommands(Protocol):
                 Equivalent to `GET` in the Redis API. Defaults to False.
 
         Returns:
-            Optional[str]:
+            Optional[Union[TOK, bytes]]:
                 If the value is successfully set, return OK.
                 If value isn't set because of only_if_exists or only_if_does_not_exist conditions, return None.
-                If return_old_value is set, return the old value as a string.
+                If return_old_value is set, return the old value as bytes.
 
         Example:
             >>> await client.set("key", "value")
@@ -397,20 +448,142 @@ class CoreCommands(Protocol):
             >>> await client.set("key", "new_value",conditional_set=ConditionalChange.ONLY_IF_EXISTS, expiry=Expiry(ExpiryType.SEC, 5))
                 'OK' # Set "new_value" to "key" only if "key" already exists, and set the key expiration to 5 seconds.
             >>> await client.set("key", "value", conditional_set=ConditionalChange.ONLY_IF_DOES_NOT_EXIST,return_old_value=True)
-                'new_value' # Returns the old value of "key".
+                b'new_value' # Returns the old value of "key".
             >>> await client.get("key")
-                'new_value' # Value wasn't modified back to being "value" because of "NX" flag.
+                b'new_value' # Value wasn't modified back to being "value" because of "NX" flag.
         """
-        args = [key, value]
-        if conditional_set:
-            args.append(conditional_set.value)
-        if return_old_value:
-            args.append("GET")
+        args = [key, value, *_SET_OPTIONS_ARGS[(conditional_set, return_old_value)]]
         if expiry is not None:
-            args.extend(expiry.get_cmd_args())
-        return cast(Optional[str], await self._execute_command(RequestType.Set, args))
+            args.extend(expiry._cmd_args)
+        return cast(
+            Optional[Union[TOK, bytes]],
+            await self._execute_command(_SET_REQUEST_TYPE, args),
+        )
+
+    async def set_ex(self, key: str, value: str, seconds: int) -> TOK:
+        """
+        Set the given key with the given value, and set the key to expire after the given number of seconds.
+        A specialized form of `set`, equivalent to `set(key, value, expiry=ExpirySet(ExpiryType.SEC, seconds))`.
+        See https://redis.io/commands/set/ for more details.
+
+        Args:
+            key (str): the key to store.
+            value (str): the value to store with the given key.
+            seconds (int): the number of seconds until the key expires.
+
+        Returns:
+            TOK: A simple OK response.
+
+        Example:
+            >>> await client.set_ex("key", "value", 5)
+                'OK' # "key" will expire in 5 seconds.
+        """
+        return cast(
+            TOK,
+            await self._execute_command(
+                _SET_REQUEST_TYPE, [key, value, "EX", str(seconds)]
+            ),
+        )
+
+    async def set_px(self, key: str, value: str, milliseconds: int) -> TOK:
+        """
+        Set the given key with the given value, and set the key to expire after the given number of milliseconds.
+        A specialized form of `set`, equivalent to `set(key, value, expiry=ExpirySet(ExpiryType.MILLSEC, milliseconds))`.
+        See https://redis.io/commands/set/ for more details.
+
+        Args:
+            key (str): the key to store.
+            value (str): the value to store with the given key.
+            milliseconds (int): the number of milliseconds until the key expires.
+
+        Returns:
+            TOK: A simple OK response.
+
+        Example:
+            >>> await client.set_px("key", "value", 500)
+                'OK' # "key" will expire in 500 milliseconds.
+        """
+        return cast(
+            TOK,
+            await self._execute_command(
+                _SET_REQUEST_TYPE, [key, value, "PX", str(milliseconds)]
+            ),
+        )
+
+    async def set_nx(self, key: str, value: str) -> Optional[TOK]:
+        """
+        Set the given key with the given value, only if the key does not already exist.
+        A specialized form of `set`, equivalent to `set(key, value, conditional_set=ConditionalChange.ONLY_IF_DOES_NOT_EXIST)`.
+        See https://redis.io/commands/set/ for more details.
+
+        Args:
+            key (str): the key to store.
+            value (str): the value to store with the given key.
+
+        Returns:
+            Optional[TOK]: If the value is successfully set, return OK.
+                If the key already exists, return None.
+
+        Example:
+            >>> await client.set_nx("key", "value")
+                'OK'
+            >>> await client.set_nx("key", "new_value")
+                None # "key" already exists, so it was not modified.
+        """
+        return cast(
+            Optional[TOK],
+            await self._execute_command(_SET_REQUEST_TYPE, [key, value, "NX"]),
+        )
+
+    async def set_xx(self, key: str, value: str) -> Optional[TOK]:
+        """
+        Set the given key with the given value, only if the key already exists.
+        A specialized form of `set`, equivalent to `set(key, value, conditional_set=ConditionalChange.ONLY_IF_EXISTS)`.
+        See https://redis.io/commands/set/ for more details.
+
+        Args:
+            key (str): the key to store.
+            value (str): the value to store with the given key.
+
+        Returns:
+            Optional[TOK]: If the value is successfully set, return OK.
+                If the key does not exist, return None.
+
+        Example:
+            >>> await client.set_xx("key", "value")
+                None # "key" does not exist, so it was not set.
+        """
+        return cast(
+            Optional[TOK],
+            await self._execute_command(_SET_REQUEST_TYPE, [key, value, "XX"]),
+        )
+
+    async def set_get(self, key: str, value: str) -> Optional[bytes]:
+        """
+        Set the given key with the given value, and return the old value stored at key.
+        A specialized form of `set`, equivalent to `set(key, value, return_old_value=True)`.
+        See https://redis.io/commands/set/ for more details.
+
+        Args:
+            key (str): the key to store.
+            value (str): the value to store with the given key.
+
+        Returns:
+            Optional[bytes]: The old value stored at `key`, or None if `key` did not exist.
+                An error is returned and SET aborted if the value stored at key is not a string.
+
+        Example:
+            >>> await client.set_get("key", "new_value")
+                b'value' # Returns the old value of "key".
+
+        Since: Redis version 6.2.0.
+        """
+        return cast(
+            Optional[bytes],
+            await self._execute_command(_SET_REQUEST_TYPE, [key, value, "GET"]),
+        )
 
-    async def get(self, key: str) -> Optional[str]:
+    async def get(self, key: str) -> Optional[bytes]:
         """
         Get the value associated with the given key, or null if no such value exists.
         See https://redis.io/commands/get/ for details.
@@ -419,13 +592,16 @@ class CoreCommands(Protocol):
             key (str): The key to retrieve from the database.
 
         Returns:
-            Optional[str]: If the key exists, returns the value of the key as a string. Otherwise, return None.
+            Optional[bytes]: If the key exists, returns the value of the key as bytes, exactly as received from the
+                server, without decoding it. Otherwise, return None.
 
         Example:
             >>> await client.get("key")
-                'value'
+                b'value'
         """
-        return cast(Optional[str], await self._execute_command(RequestType.Get, [key]))
+        return cast(
+            Optional[bytes], await self._execute_command(_GET_REQUEST_TYPE, [key])
+        )
 
     async def getdel(self, key: str) -> Optional[str]:
         """
@@ -5305,7 +5481,7 @@ class CoreCommands(Protocol):
             >>> await client.bitfield("my_key", [BitFieldSet(UnsignedEncoding(2), Offset(1), 3), BitFieldGet(UnsignedEncoding(2), Offset(1))])
                 [2, 3]  # The old value at offset 1 with an unsigned encoding of 2 was 2. The new value at offset 1 with an unsigned encoding of 2 is 3.
         """
-        args = [key] + _create_bitfield_args(subcommands)
+        args = _create_bitfield_args(key, subcommands)
         return cast(
             List[Optional[int]],
             await self._execute_command(RequestType.BitField, args),
@@ -5333,7 +5509,7 @@ class CoreCommands(Protocol):
 
         Since: Redis version 6.0.0.
         """
-        args = [key] + _create_bitfield_read_only_args(subcommands)
+        args = _create_bitfield_read_only_args(key, subcommands)
         return cast(
             List[int],
             await self._execute_command(RequestType.BitFieldReadOnly, args),
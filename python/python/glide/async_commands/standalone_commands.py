@@ -2,22 +2,23 @@
 
 from __future__ import annotations
 
-from typing import Dict, List, Mapping, Optional, cast
+from typing import Dict, List, Mapping, Optional, Sequence, cast
 
 from glide.async_commands.command_args import Limit, OrderBy
 from glide.async_commands.core import (
+    _CUSTOM_COMMAND_REQUEST_TYPE,
     CoreCommands,
     FlushMode,
     InfoSection,
     _build_sort_args,
 )
 from glide.async_commands.transaction import BaseTransaction, Transaction
-from glide.constants import OK, TOK, TResult
+from glide.constants import OK, TOK, TEncodable, TResult
 from glide.protobuf.redis_request_pb2 import RequestType
 
 
 class StandaloneCommands(CoreCommands):
-    async def custom_command(self, command_args: List[str]) -> TResult:
+    async def custom_command(self, command_args: Sequence[TEncodable]) -> TResult:
         """
         Executes a single command, without checking inputs.
         See the [Glide for Redis Wiki](https://github.com/aws/glide-for-redis/wiki/General-Concepts#custom-command)
@@ -27,13 +28,13 @@ class StandaloneCommands(CoreCommands):
 
                 connection.customCommand(["CLIENT", "LIST","TYPE", "PUBSUB"])
         Args:
-            command_args (List[str]): List of strings of the command's arguments.
+            command_args (Sequence[TEncodable]): Sequence of strings or bytes of the command's arguments.
             Every part of the command, including the command name and subcommands, should be added as a separate value in args.
 
         Returns:
             TResult: The returning value depends on the executed command and the route
         """
-        return await self._execute_command(RequestType.CustomCommand, command_args)
+        return await self._execute_command(_CUSTOM_COMMAND_REQUEST_TYPE, command_args)
 
     async def info(
         self,
@@ -1,7 +1,7 @@
 # Copyright Valkey GLIDE Project Contributors - SPDX Identifier: Apache-2.0
 
 import threading
-from typing import List, Mapping, Optional, Tuple, TypeVar, Union
+from typing import List, Mapping, Optional, Sequence, Tuple, TypeVar, Union
 
 from glide.async_commands.bitmap import (
     BitFieldGet,
@@ -14,7 +14,9 @@ from glide.async_commands.bitmap import (
 )
 from glide.async_commands.command_args import Limit, ListDirection, OrderBy
 from glide.async_commands.core import (
+    _SET_OPTIONS_ARGS,
     ConditionalChange,
+    CoreCommands,
     ExpireOptions,
     ExpiryGetEx,
     ExpirySet,
@@ -52,6 +54,8 @@ from glide.async_commands.stream import (
     StreamTrimOptions,
     _create_xpending_range_args,
 )
+from glide.constants import TEncodable, TResult
+from glide.exceptions import RedisError
 from glide.protobuf.redis_request_pb2 import RequestType
 
 TTransaction = TypeVar("TTransaction", bound="BaseTransaction")
@@ -73,11 +77,13 @@ class BaseTransaction:
     """
 
     def __init__(self) -> None:
-        self.commands: List[Tuple[RequestType.ValueType, List[str]]] = []
+        self.commands: List[Tuple[RequestType.ValueType, Sequence[TEncodable]]] = []
         self.lock = threading.Lock()
 
     def append_command(
-        self: TTransaction, request_type: RequestType.ValueType, args: List[str]
+        self: TTransaction,
+        request_type: RequestType.ValueType,
+        args: Sequence[TEncodable],
     ) -> TTransaction:
         self.lock.acquire()
         try:
@@ -99,7 +105,7 @@ class BaseTransaction:
             key (str): The key to retrieve from the database.
 
         Command response:
-            Optional[str]: If the key exists, returns the value of the key as a string. Otherwise, return None.
+            Optional[bytes]: If the key exists, returns the value of the key as bytes. Otherwise, return None.
         """
         return self.append_command(RequestType.Get, [key])
 
@@ -166,23 +172,102 @@ class BaseTransaction:
                 Equivalent to `GET` in the Redis API. Defaults to False.
 
         Command response:
-            Optional[str]:
+            Optional[Union[TOK, bytes]]:
                 If the value is successfully set, return OK.
                 If value isn't set because of only_if_exists or only_if_does_not_exist conditions, return None.
-                If return_old_value is set, return the old value as a string.
-        """
-        args = [key, value]
-        if conditional_set:
-            if conditional_set == ConditionalChange.ONLY_IF_EXISTS:
-                args.append("XX")
-            if conditional_set == ConditionalChange.ONLY_IF_DOES_NOT_EXIST:
-                args.append("NX")
-        if return_old_value:
-            args.append("GET")
+                If return_old_value is set, return the old value as bytes.
+        """
+        args = [key, value, *_SET_OPTIONS_ARGS[(conditional_set, return_old_value)]]
         if expiry is not None:
-            args.extend(expiry.get_cmd_args())
+            args.extend(expiry._cmd_args)
         return self.append_command(RequestType.Set, args)
 
+    def set_ex(self: TTransaction, key: str, value: str, seconds: int) -> TTransaction:
+        """
+        Set the given key with the given value, and set the key to expire after the given number of seconds.
+        A specialized form of `set`, equivalent to `set(key, value, expiry=ExpirySet(ExpiryType.SEC, seconds))`.
+        See https://redis.io/commands/set/ for more details.
+
+        Args:
+            key (str): the key to store.
+            value (str): the value to store with the given key.
+            seconds (int): the number of seconds until the key expires.
+
+        Command response:
+            TOK: A simple OK response.
+        """
+        return self.append_command(RequestType.Set, [key, value, "EX", str(seconds)])
+
+    def set_px(
+        self: TTransaction, key: str, value: str, milliseconds: int
+    ) -> TTransaction:
+        """
+        Set the given key with the given value, and set the key to expire after the given number of milliseconds.
+        A specialized form of `set`, equivalent to `set(key, value, expiry=ExpirySet(ExpiryType.MILLSEC, milliseconds))`.
+        See https://redis.io/commands/set/ for more details.
+
+        Args:
+            key (str): the key to store.
+            value (str): the value to store with the given key.
+            milliseconds (int): the number of milliseconds until the key expires.
+
+        Command response:
+            TOK: A simple OK response.
+        """
+        return self.append_command(
+            RequestType.Set, [key, value, "PX", str(milliseconds)]
+        )
+
+    def set_nx(self: TTransaction, key: str, value: str) -> TTransaction:
+        """
+        Set the given key with the given value, only if the key does not already exist.
+        A specialized form of `set`, equivalent to `set(key, value, conditional_set=ConditionalChange.ONLY_IF_DOES_NOT_EXIST)`.
+        See https://redis.io/commands/set/ for more details.
+
+        Args:
+            key (str): the key to store.
+            value (str): the value to store with the given key.
+
+        Command response:
+            Optional[TOK]: If the value is successfully set, return OK.
+                If the key already exists, return None.
+        """
+        return self.append_command(RequestType.Set, [key, value, "NX"])
+
+    def set_xx(self: TTransaction, key: str, value: str) -> TTransaction:
+        """
+        Set the given key with the given value, only if the key already exists.
+        A specialized form of `set`, equivalent to `set(key, value, conditional_set=ConditionalChange.ONLY_IF_EXISTS)`.
+        See https://redis.io/commands/set/ for more details.
+
+        Args:
+            key (str): the key to store.
+            value (str): the value to store with the given key.
+
+        Command response:
+            Optional[TOK]: If the value is successfully set, return OK.
+                If the key does not exist, return None.
+        """
+        return self.append_command(RequestType.Set, [key, value, "XX"])
+
+    def set_get(self: TTransaction, key: str, value: str) -> TTransaction:
+        """
+        Set the given key with the given value, and return the old value stored at key.
+        A specialized form of `set`, equivalent to `set(key, value, return_old_value=True)`.
+        See https://redis.io/commands/set/ for more details.
+
+        Args:
+            key (str): the key to store.
+            value (str): the value to store with the given key.
+
+        Command response:
+            Optional[bytes]: The old value stored at `key`, or None if `key` did not exist.
+                An error is returned and SET aborted if the value stored at key is not a string.
+
+        Since: Redis version 6.2.0.
+        """
+        return self.append_command(RequestType.Set, [key, value, "GET"])
+
     def strlen(self: TTransaction, key: str) -> TTransaction:
         """
         Get the length of the string value stored at `key`.
@@ -229,7 +314,9 @@ class BaseTransaction:
         """
         return self.append_command(RequestType.RenameNX, [key, new_key])
 
-    def custom_command(self: TTransaction, command_args: List[str]) -> TTransaction:
+    def custom_command(
+        self: TTransaction, command_args: Sequence[TEncodable]
+    ) -> TTransaction:
         """
         Executes a single command, without checking inputs.
         See the [Glide for Redis Wiki](https://github.com/aws/glide-for-redis/wiki/General-Concepts#custom-command)
@@ -240,7 +327,7 @@ class BaseTransaction:
                 transaction.customCommand(["CLIENT", "LIST","TYPE", "PUBSUB"])
 
         Args:
-            command_args (List[str]): List of strings of the command's arguments.
+            command_args (Sequence[TEncodable]): Sequence of strings or bytes of the command's arguments.
             Every part of the command, including the command name and subcommands, should be added as a separate value in args.
 
         Command response:
@@ -3817,7 +3904,7 @@ class BaseTransaction:
                   underflow occurs. "OVERFLOW" does not return a value and does not contribute a value to the list
                   response.
         """
-        args = [key] + _create_bitfield_args(subcommands)
+        args = _create_bitfield_args(key, subcommands)
         return self.append_command(RequestType.BitField, args)
 
     def bitfield_read_only(
@@ -3837,7 +3924,7 @@ class BaseTransaction:
 
         Since: Redis version 6.0.0.
         """
-        args = [key] + _create_bitfield_read_only_args(subcommands)
+        args = _create_bitfield_read_only_args(key, subcommands)
         return self.append_command(RequestType.BitFieldReadOnly, args)
 
     def object_encoding(self: TTransaction, key: str) -> TTransaction:
@@ -4552,3 +4639,63 @@ class ClusterTransaction(BaseTransaction):
         return self.append_command(RequestType.Copy, args)
 
     # TODO: add all CLUSTER commands
+
+
+class Pipeline(BaseTransaction):
+    """
+    Queues commands and sends them to the server together, saving a round-trip per command.
+    Unlike a transaction, the commands are not wrapped with MULTI/EXEC: each command is sent as an independent
+    request, so they are not executed atomically and, in cluster mode, may be routed to different nodes.
+
+    When used as an async context manager, the commands still queued when the block exits are executed.
+    Since their results are discarded, the first error among them, if any, is raised instead.
+
+    Command Response:
+        The response for each command depends on the executed Redis command. Specific response types
+        are documented alongside each method.
+
+    Example:
+        >>> async with client.pipeline() as pipeline:
+        ...     for key in ["key1", "key2"]:
+        ...         pipeline.get(key)
+        ...     results = await pipeline.execute()
+        >>> results
+        [b"value1", b"value2"]
+        >>> pipeline.set("key", "value").lpush("key", ["element"])
+        >>> await pipeline.execute()
+        [OK, RequestError("WRONGTYPE Operation against a key holding the wrong kind of value")]
+    """
+
+    def __init__(self, client: CoreCommands) -> None:
+        super().__init__()
+        self._client = client
+
+    async def execute(self) -> List[Union[TResult, RedisError]]:
+        """
+        Sends all queued commands to the server and clears the queue.
+
+        Returns:
+            List[Union[TResult, RedisError]]: A list of results corresponding to the execution of each queued command,
+                in order. Since the commands are executed independently, a failed command doesn't affect the others:
+                the error it raised is returned in place of its result.
+
+        Raises:
+            ClosingError: If the client was closed before all the responses were received.
+        """
+        with self.lock:
+            if not self.commands:
+                return []
+            # The queue is only cleared once the client accepted the commands,
+            # so the commands are kept if they can't be sent, e.g. due to an argument that can't be encoded
+            response = self._client._execute_pipeline(self.commands)
+            self.commands.clear()
+        return await response
+
+    async def __aenter__(self) -> "Pipeline":
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        if exc_type is None:
+            for result in await self.execute():
+                if isinstance(result, RedisError):
+                    raise result
@@ -8,6 +8,7 @@ from glide.routes import ByAddressRoute, RandomNode, SlotIdRoute, SlotKeyRoute
 
 OK: str = "OK"
 DEFAULT_READ_BYTES_SIZE: int = pow(2, 16)
+MAX_WRITE_BATCH_SIZE: int = 512
 # Typing
 T = TypeVar("T")
 TOK = Literal["OK"]
@@ -27,6 +28,7 @@ TResult = Union[
     Mapping[bytes, "TResult"],
 ]
 TRequest = Union[RedisRequest, ConnectionRequest]
+TEncodable = Union[str, bytes]
 # When routing to a single node, response will be T
 # Otherwise, response will be : {Address : response , ... } with type of Dict[str, T].
 TClusterResponse = Union[T, Dict[bytes, T]]
@@ -3,19 +3,39 @@
 import asyncio
 import sys
 import threading
-from typing import Any, Dict, List, Optional, Tuple, Type, Union, cast
+from typing import (
+    Any,
+    Awaitable,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    Union,
+    cast,
+)
 
 import async_timeout
 from glide.async_commands.cluster_commands import ClusterCommands
 from glide.async_commands.core import CoreCommands
 from glide.async_commands.standalone_commands import StandaloneCommands
+from glide.async_commands.transaction import Pipeline
 from glide.config import BaseClientConfiguration
-from glide.constants import DEFAULT_READ_BYTES_SIZE, OK, TRequest, TResult
+from glide.constants import (
+    DEFAULT_READ_BYTES_SIZE,
+    MAX_WRITE_BATCH_SIZE,
+    OK,
+    TEncodable,
+    TRequest,
+    TResult,
+)
 from glide.exceptions import (
     ClosingError,
     ConfigurationError,
     ConnectionError,
     ExecAbortError,
+    RedisError,
     RequestError,
     TimeoutError,
 )
@@ -60,7 +80,9 @@ class BaseClient(CoreCommands):
         self._available_futures: dict[int, asyncio.Future] = {}
         self._available_callback_indexes: List[int] = list()
         self._buffered_requests: List[TRequest] = list()
-        self._writer_lock = threading.Lock()
+        self._is_flush_scheduled: bool = False
+        # Writes are only made from the event loop's thread, so a flag is enough to serialize them
+        self._is_writing: bool = False
         self.socket_path: Optional[str] = None
         self._reader_task: Optional[asyncio.Task] = None
         self._is_closed: bool = False
@@ -161,7 +183,7 @@ class BaseClient(CoreCommands):
 
     def _get_future(self, callback_idx: int) -> asyncio.Future:
         response_future: asyncio.Future = asyncio.Future()
-        self._available_futures.update({callback_idx: response_future})
+        self._available_futures[callback_idx] = response_future
         return response_future
 
     def _get_protobuf_conn_request(self) -> ConnectionRequest:
@@ -176,52 +198,68 @@ class BaseClient(CoreCommands):
             raise ClosingError(response_future.result())
 
     def _create_write_task(self, request: TRequest):
-        asyncio.create_task(self._write_or_buffer_request(request))
+        self._create_batch_write_task([request])
+
+    def _create_batch_write_task(self, requests: List[TRequest]):
+        # A single write task is scheduled at a time. Requests buffered before it starts,
+        # e.g. all the requests made during the same event loop iteration, are flushed to the socket together
+        self._buffered_requests.extend(requests)
+        if not self._is_flush_scheduled:
+            self._is_flush_scheduled = True
+            asyncio.create_task(self._flush_buffered_requests())
+
+    async def _flush_buffered_requests(self) -> None:
+        self._is_flush_scheduled = False
+        await self._write_or_buffer_requests([])
 
     async def _write_or_buffer_request(self, request: TRequest):
-        self._buffered_requests.append(request)
-        if self._writer_lock.acquire(False):
+        await self._write_or_buffer_requests([request])
+
+    async def _write_or_buffer_requests(self, requests: List[TRequest]):
+        self._buffered_requests.extend(requests)
+        if not self._is_writing:
+            self._is_writing = True
             try:
                 while len(self._buffered_requests) > 0:
                     await self._write_buffered_requests_to_socket()
 
             finally:
-                self._writer_lock.release()
+                self._is_writing = False
 
     async def _write_buffered_requests_to_socket(self) -> None:
-        requests = self._buffered_requests
-        self._buffered_requests = list()
+        # Bound the batch size so that a burst of requests doesn't delay the first ones in the batch
+        requests = self._buffered_requests[:MAX_WRITE_BATCH_SIZE]
+        del self._buffered_requests[:MAX_WRITE_BATCH_SIZE]
         b_arr = bytearray()
         for request in requests:
             ProtobufCodec.encode_delimited(b_arr, request)
         self._writer.write(b_arr)
         await self._writer.drain()
 
-    # TODO: change `str` to `TEncodable` where `TEncodable = Union[str, bytes]`
-    def _encode_arg(self, arg: str) -> bytes:
+    def _encode_arg(self, arg: TEncodable) -> bytes:
         """
-        Converts a string argument to bytes.
+        Converts a string argument to bytes. Arguments that are already encoded are returned as is.
 
         Args:
-            arg (str): An encodable argument.
+            arg (TEncodable): An encodable argument.
 
         Returns:
             bytes: The encoded argument as bytes.
         """
-
+        if isinstance(arg, bytes):
+            return arg
         # TODO: Allow passing different encoding options
         return bytes(arg, encoding="utf8")
 
-    # TODO: change `List[str]` to `List[TEncodable]` where `TEncodable = Union[str, bytes]`
     def _encode_and_sum_size(
         self,
-        args_list: Optional[List[str]],
+        args_list: Optional[Sequence[TEncodable]],
     ) -> Tuple[List[bytes], int]:
         """
         Encodes the list and calculates the total memory size.
 
         Args:
-            args_list (Optional[List[str]]): A list of strings to be converted to bytes.
+            args_list (Optional[Sequence[TEncodable]]): A list of strings or bytes to be converted to bytes.
                                                     If None or empty, returns ([], 0).
 
         Returns:
@@ -237,10 +275,27 @@ class BaseClient(CoreCommands):
             args_size += sys.getsizeof(encoded_arg)
         return (encoded_args_list, args_size)
 
+    def _set_command_args(self, command: Command, args: Sequence[TEncodable]) -> None:
+        """
+        Encodes the arguments and sets them on the command. Arguments that are too large to be sent
+        in the protobuf message are passed to the Rust core as a pointer instead.
+
+        Args:
+            command (Command): The command to set the arguments on.
+            args (Sequence[TEncodable]): The command's arguments.
+        """
+        # For now, we allow the user to pass the command as array of strings
+        # we convert them here into bytes (the datatype that our rust core expects)
+        (encoded_args, args_size) = self._encode_and_sum_size(args)
+        if args_size < MAX_REQUEST_ARGS_LEN:
+            command.args_array.args[:] = encoded_args
+        else:
+            command.args_vec_pointer = create_leaked_bytes_vec(encoded_args)
+
     async def _execute_command(
         self,
         request_type: RequestType.ValueType,
-        args: List[str],
+        args: Sequence[TEncodable],
         route: Optional[Route] = None,
     ) -> TResult:
         if self._is_closed:
@@ -250,23 +305,13 @@ class BaseClient(CoreCommands):
         request = RedisRequest()
         request.callback_idx = self._get_callback_index()
         request.single_command.request_type = request_type
-        request.single_command.args_array.args[:] = [
-            bytes(elem, encoding="utf8") if isinstance(elem, str) else elem
-            for elem in args
-        ]
-        (encoded_args, args_size) = self._encode_and_sum_size(args)
-        if args_size < MAX_REQUEST_ARGS_LEN:
-            request.single_command.args_array.args[:] = encoded_args
-        else:
-            request.single_command.args_vec_pointer = create_leaked_bytes_vec(
-                encoded_args
-            )
+        self._set_command_args(request.single_command, args)
         set_protobuf_route(request, route)
         return await self._write_request_await_response(request)
 
     async def _execute_transaction(
         self,
-        commands: List[Tuple[RequestType.ValueType, List[str]]],
+        commands: List[Tuple[RequestType.ValueType, Sequence[TEncodable]]],
         route: Optional[Route] = None,
     ) -> List[TResult]:
         if self._is_closed:
@@ -279,18 +324,71 @@ class BaseClient(CoreCommands):
         for requst_type, args in commands:
             command = Command()
             command.request_type = requst_type
-            # For now, we allow the user to pass the command as array of strings
-            # we convert them here into bytes (the datatype that our rust core expects)
-            (encoded_args, args_size) = self._encode_and_sum_size(args)
-            if args_size < MAX_REQUEST_ARGS_LEN:
-                command.args_array.args[:] = encoded_args
-            else:
-                command.args_vec_pointer = create_leaked_bytes_vec(encoded_args)
+            self._set_command_args(command, args)
             transaction_commands.append(command)
         request.transaction.commands.extend(transaction_commands)
         set_protobuf_route(request, route)
         return await self._write_request_await_response(request)
 
+    def _execute_pipeline(
+        self,
+        commands: List[Tuple[RequestType.ValueType, Sequence[TEncodable]]],
+    ) -> Awaitable[List[Union[TResult, RedisError]]]:
+        if self._is_closed:
+            raise ClosingError(
+                "Unable to execute requests; the client is closed. Please create a new client."
+            )
+        # All the commands are encoded before any of them is registered, so a command that fails to encode
+        # doesn't leave behind futures that are never written nor resolved
+        requests: List[RedisRequest] = []
+        for request_type, args in commands:
+            request = RedisRequest()
+            request.single_command.request_type = request_type
+            self._set_command_args(request.single_command, args)
+            requests.append(request)
+        batch: List[TRequest] = []
+        response_futures: List[asyncio.Future] = []
+        for request in requests:
+            request.callback_idx = self._get_callback_index()
+            # The future must be registered before fetching the next callback index,
+            # otherwise the same index may be handed out twice
+            response_futures.append(self._get_future(request.callback_idx))
+            batch.append(request)
+        # All the requests are buffered together, so they are written to the socket in a single batch
+        self._create_batch_write_task(batch)
+        return self._await_pipeline_responses(response_futures)
+
+    async def _await_pipeline_responses(
+        self, response_futures: List[asyncio.Future]
+    ) -> List[Union[TResult, RedisError]]:
+        # The commands aren't atomic, so a failed command doesn't affect the others:
+        # its error is returned in place of its result
+        results = await asyncio.gather(*response_futures, return_exceptions=True)
+        for result in results:
+            # Errors that concern the client rather than a specific command are raised
+            if isinstance(result, (ClosingError, asyncio.CancelledError)):
+                raise result
+        return cast(List[Union[TResult, RedisError]], results)
+
+    def pipeline(self) -> Pipeline:
+        """
+        Creates a pipeline for this client. Commands queued on the pipeline are sent to the server together
+        once `execute` is called or the `async with` block exits, instead of paying a round-trip per command.
+        Commands still queued when the `async with` block exits are executed, and the first error among
+        their results is raised.
+
+        Returns:
+            Pipeline: A new, empty pipeline bound to this client.
+
+        Example:
+            >>> async with client.pipeline() as pipeline:
+            ...     pipeline.set("key", "value")
+            ...     pipeline.get("key")
+            ...     await pipeline.execute()
+            [OK, b"value"]
+        """
+        return Pipeline(self)
+
     async def _execute_script(
         self,
         hash: str,
@@ -428,8 +526,7 @@ class BaseClient(CoreCommands):
         # futures map
         response_future = self._get_future(request.callback_idx)
         self._create_write_task(request)
-        await response_future
-        return response_future.result()
+        return await response_future
 
     def _get_callback_index(self) -> int:
         try:
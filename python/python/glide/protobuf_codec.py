@@ -14,8 +14,7 @@ All of the Varint functions were copied from https://github.com/protocolbuffers/
 class ProtobufCodec:
     @classmethod
     def _decode_varint_32(cls, buffer, pos):
-        decoder_func = cls._varint_decoder((1 << 32) - 1, int)
-        return decoder_func(buffer, pos)
+        return _decode_varint_32(buffer, pos)
 
     @staticmethod
     def _varint_decoder(mask, result_type):
@@ -67,8 +66,7 @@ class ProtobufCodec:
         """Encode the given integer as a varint and return the bytes."""
 
         pieces: List[bytes] = []
-        func = cls._varint_encoder()
-        func(pieces.append, value)
+        _encode_varint(pieces.append, value)
         return b"".join(pieces)
 
     @classmethod
@@ -100,10 +98,14 @@ class ProtobufCodec:
     @classmethod
     def encode_delimited(cls, b_arr: bytearray, message: message.Message) -> None:
         bytes_request = message.SerializeToString()
-        varint = cls._varint_bytes(len(bytes_request))
-        b_arr.extend(varint)
+        _encode_varint(b_arr.extend, len(bytes_request))
         b_arr.extend(bytes_request)
 
 
+# The varint encoder and decoder are created once, rather than for every encoded or decoded message
+_decode_varint_32 = ProtobufCodec._varint_decoder((1 << 32) - 1, int)
+_encode_varint = ProtobufCodec._varint_encoder()
+
+
 class PartialMessageException(Exception):
     pass
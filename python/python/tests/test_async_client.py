@@ -161,6 +161,19 @@ class TestGlideClients:
             task.add_done_callback(running_tasks.discard)
         await asyncio.gather(*(list(running_tasks)))
 
+    @pytest.mark.parametrize("cluster_mode", [True, False])
+    @pytest.mark.parametrize("protocol", [ProtocolVersion.RESP2, ProtocolVersion.RESP3])
+    async def test_client_handle_requests_burst_larger_than_write_batch(
+        self, redis_client: TGlideClient
+    ):
+        # All the requests are buffered in the same event loop iteration, and are written in several batches
+        num_of_requests = 2000
+        keys = [get_random_string(10) for _ in range(num_of_requests)]
+        results = await asyncio.gather(*(redis_client.set(key, key) for key in keys))
+        assert results == [OK] * num_of_requests
+        values = await asyncio.gather(*(redis_client.get(key) for key in keys))
+        assert values == [key.encode() for key in keys]
+
     @pytest.mark.parametrize("cluster_mode", [True, False])
     @pytest.mark.parametrize("protocol", [ProtocolVersion.RESP2, ProtocolVersion.RESP3])
     async def test_can_connect_with_auth_requirepass(
@@ -287,6 +300,13 @@ class TestCommands:
         assert await redis_client.set(key, value) == OK
         assert await redis_client.get(key) == value.encode()
 
+    @pytest.mark.parametrize("cluster_mode", [True, False])
+    @pytest.mark.parametrize("protocol", [ProtocolVersion.RESP2, ProtocolVersion.RESP3])
+    async def test_custom_command_with_encoded_args(self, redis_client: TGlideClient):
+        key = get_random_string(10)
+        assert await redis_client.custom_command([b"SET", key.encode(), b"value"]) == OK
+        assert await redis_client.get(key) == b"value"
+
     @pytest.mark.parametrize("cluster_mode", [True, False])
     @pytest.mark.parametrize("protocol", [ProtocolVersion.RESP3])
     async def test_use_resp3_protocol(self, redis_client: TGlideClient):
@@ -338,6 +358,31 @@ class TestCommands:
         assert res == value.encode()
         assert await redis_client.get(key) == new_value.encode()
 
+    @pytest.mark.parametrize("cluster_mode", [True, False])
+    @pytest.mark.parametrize("protocol", [ProtocolVersion.RESP2, ProtocolVersion.RESP3])
+    async def test_set_specialized_variants(self, redis_client: TGlideClient):
+        key = get_random_string(10)
+        value = get_random_string(10)
+
+        assert await redis_client.set_xx(key, value) is None
+        assert await redis_client.get(key) is None
+        assert await redis_client.set_nx(key, value) == OK
+        assert await redis_client.set_nx(key, "foobar") is None
+        assert await redis_client.get(key) == value.encode()
+        assert await redis_client.set_xx(key, "foobar") == OK
+        assert await redis_client.get(key) == b"foobar"
+
+        assert await redis_client.set_ex(key, value, 10) == OK
+        assert 0 < await redis_client.ttl(key) <= 10
+        assert await redis_client.set_px(key, value, 10000) == OK
+        assert 0 < await redis_client.pttl(key) <= 10000
+
+        min_version = "6.2.0"
+        if not await check_if_server_version_lt(redis_client, min_version):
+            new_value = get_random_string(10)
+            assert await redis_client.set_get(key, new_value) == value.encode()
+            assert await redis_client.get(key) == new_value.encode()
+
     @pytest.mark.parametrize("cluster_mode", [True, False])
     @pytest.mark.parametrize("protocol", [ProtocolVersion.RESP2, ProtocolVersion.RESP3])
     async def test_custom_command_single_arg(self, redis_client: TGlideClient):
@@ -8028,6 +8073,9 @@ class TestCommandsUnitTests:
         )
         assert exp_unix_millisec_datetime.get_cmd_args() == ["PXAT", "1682639759342"]
 
+        exp_keep_ttl = ExpirySet(ExpiryType.KEEP_TTL, None)
+        assert exp_keep_ttl.get_cmd_args() == ["KEEPTTL"]
+
     def test_get_expiry_cmd_args(self):
         exp_sec = ExpiryGetEx(ExpiryTypeGetEx.SEC, 5)
         assert exp_sec.get_cmd_args() == ["EX", "5"]
@@ -8076,6 +8124,12 @@ class TestCommandsUnitTests:
         with pytest.raises(ValueError):
             ExpirySet(ExpiryType.SEC, 5.5)
 
+        with pytest.raises(ValueError):
+            ExpirySet(ExpiryType.MILLSEC, datetime.now())
+
+        with pytest.raises(ValueError):
+            ExpirySet(ExpiryType.KEEP_TTL, 5)
+
     def test_is_single_response(self):
         assert is_single_response("This is a string value", "")
         assert is_single_response(["value", "value"], [""])
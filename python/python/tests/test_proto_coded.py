@@ -55,3 +55,23 @@ class TestProtobufCodec:
         decoded_varint, res_len = ProtobufCodec._decode_varint_32(varint, 0)
         assert res_len == len(varint)
         assert decoded_varint == value
+
+    def test_encode_decode_delimited_multiple_messages(self):
+        b_arr = bytearray()
+        # a message longer than 127 bytes, so its length is encoded as a multi-byte varint
+        large_arg = b"a" * 300
+        for callback_idx in range(3):
+            request = RedisRequest()
+            request.callback_idx = callback_idx
+            request.single_command.request_type = RequestType.Set
+            request.single_command.args_array.args[:] = [b"foo", large_arg]
+            ProtobufCodec.encode_delimited(b_arr, request)
+        b_arr_view = memoryview(b_arr)
+        offset = 0
+        for callback_idx in range(3):
+            parsed_request, offset = ProtobufCodec.decode_delimited(
+                b_arr, b_arr_view, offset, RedisRequest
+            )
+            assert parsed_request.callback_idx == callback_idx
+            assert parsed_request.single_command.args_array.args == [b"foo", large_arg]
+        assert offset == len(b_arr)
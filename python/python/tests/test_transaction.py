@@ -1,11 +1,12 @@
 # Copyright Valkey GLIDE Project Contributors - SPDX Identifier: Apache-2.0
 
+import asyncio
 import time
 from datetime import date, datetime, timedelta, timezone
 from typing import List, Union, cast
 
 import pytest
-from glide import RequestError
+from glide import ClosingError, RequestError
 from glide.async_commands.bitmap import (
     BitFieldGet,
     BitFieldSet,
@@ -175,6 +176,22 @@ async def transaction_test(
     transaction.getdel(key)
     args.append(None)
 
+    transaction.set_xx(key, value)
+    args.append(None)
+    transaction.set_nx(key, value)
+    args.append(OK)
+    transaction.set_nx(key, value2)
+    args.append(None)
+    transaction.set_xx(key, value2)
+    args.append(OK)
+    transaction.set_ex(key, value, 10)
+    args.append(OK)
+    transaction.set_px(key, value, 10000)
+    args.append(OK)
+    if not await check_if_server_version_lt(redis_client, "6.2.0"):
+        transaction.set_get(key, value2)
+        args.append(value_bytes)
+
     transaction.mset({key: value, key2: value2})
     args.append(OK)
     transaction.msetnx({key: value, key2: value2})
@@ -965,3 +982,82 @@ class TestTransaction:
         for element in results:
             assert isinstance(element, bytes)
             assert b"Redis ver. " in element
+
+
+@pytest.mark.asyncio
+class TestPipeline:
+    @pytest.mark.parametrize("cluster_mode", [True, False])
+    @pytest.mark.parametrize("protocol", [ProtocolVersion.RESP2, ProtocolVersion.RESP3])
+    async def test_pipeline_execute(self, redis_client: TGlideClient):
+        keys = [get_random_string(10) for _ in range(5)]
+        async with redis_client.pipeline() as pipeline:
+            for key in keys:
+                pipeline.set(key, f"value-{key}")
+            for key in keys:
+                pipeline.get(key)
+            results = await pipeline.execute()
+        assert results == [OK] * len(keys) + [f"value-{key}".encode() for key in keys]
+        # the queue is cleared after execution
+        assert await pipeline.execute() == []
+
+    @pytest.mark.parametrize("cluster_mode", [True, False])
+    @pytest.mark.parametrize("protocol", [ProtocolVersion.RESP2, ProtocolVersion.RESP3])
+    async def test_pipeline_flushes_on_exit(self, redis_client: TGlideClient):
+        key = get_random_string(10)
+        async with redis_client.pipeline() as pipeline:
+            pipeline.set(key, "value")
+        assert await redis_client.get(key) == b"value"
+
+    @pytest.mark.parametrize("cluster_mode", [True, False])
+    @pytest.mark.parametrize("protocol", [ProtocolVersion.RESP2, ProtocolVersion.RESP3])
+    async def test_pipeline_returns_errors_in_place(self, redis_client: TGlideClient):
+        key = get_random_string(10)
+        pipeline = redis_client.pipeline()
+        pipeline.set(key, "value").lpush(key, ["element"]).get(key)
+        results = await pipeline.execute()
+        assert len(results) == 3
+        assert results[0] == OK
+        assert isinstance(results[1], RequestError)
+        # commands are not atomic, the commands following the failed one were executed
+        assert results[2] == b"value"
+
+    @pytest.mark.parametrize("cluster_mode", [True, False])
+    @pytest.mark.parametrize("protocol", [ProtocolVersion.RESP2, ProtocolVersion.RESP3])
+    async def test_pipeline_raises_on_exit_when_command_fails(
+        self, redis_client: TGlideClient
+    ):
+        key = get_random_string(10)
+        with pytest.raises(RequestError):
+            async with redis_client.pipeline() as pipeline:
+                pipeline.set(key, "value").lpush(key, ["element"])
+        # the other commands were still executed
+        assert await redis_client.get(key) == b"value"
+
+    @pytest.mark.parametrize("cluster_mode", [True, False])
+    @pytest.mark.parametrize("protocol", [ProtocolVersion.RESP2, ProtocolVersion.RESP3])
+    async def test_pipeline_raises_closing_error(self, redis_client: TGlideClient):
+        pipeline = redis_client.pipeline()
+        pipeline.custom_command(["BLPOP", get_random_string(10), "1"])
+        execution = asyncio.create_task(pipeline.execute())
+        await asyncio.sleep(0.1)
+        await redis_client.close()
+        # the client's closing isn't the command's error, so it's raised rather than returned in place
+        with pytest.raises(ClosingError):
+            await execution
+
+    @pytest.mark.parametrize("cluster_mode", [True, False])
+    @pytest.mark.parametrize("protocol", [ProtocolVersion.RESP2, ProtocolVersion.RESP3])
+    async def test_pipeline_keeps_commands_that_fail_to_encode(
+        self, redis_client: TGlideClient
+    ):
+        key = get_random_string(10)
+        pipeline = redis_client.pipeline()
+        pipeline.set(key, "value").custom_command(["SET", 5, "value"])  # type: ignore
+        with pytest.raises(TypeError):
+            await pipeline.execute()
+        # none of the commands was sent, and they are still queued
+        assert len(pipeline.commands) == 2
+        assert await redis_client.get(key) is None
+        pipeline.clear()
+        pipeline.set(key, "value")
+        assert await pipeline.execute() == [OK]